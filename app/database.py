@@ -1,90 +1,185 @@
-from typing import List, Optional, Dict
-from datetime import datetime
+from typing import Optional, Dict, Set
+import itertools
+import sys
+import threading
+import time
 
-from .models import Task, TaskCreate, TaskUpdate, TaskStatus
+import orjson
+
+from .models import TaskCreate, TaskRow, TaskUpdate, TaskStatus
 
 
 class TaskDatabase:
     """In-memory database for tasks"""
 
     def __init__(self):
-        self._tasks: Dict[int, Task] = {}
-        self._next_id = 1
+        self._tasks: Dict[int, TaskRow] = {}
+        self._id_iter = itertools.count(1)
+        # Secondary index: status value -> ids of tasks with that status
+        self._by_status: Dict[str, Set[int]] = {s.value: set() for s in TaskStatus}
+        # Pre-serialized JSON for each task, refreshed whenever it changes
+        self._cached_json: Dict[int, bytes] = {}
+        # JSON array of every task, rebuilt lazily after any mutation
+        self._all_json_cache: Optional[bytes] = None
+        # Same, per status value for the filter endpoint
+        self._status_json_cache: Dict[str, bytes] = {}
+        # Endpoints run in FastAPI's threadpool, so mutations must not interleave
+        self._lock = threading.Lock()
         # Add some sample data
         self._init_sample_data()
 
     def _init_sample_data(self):
-        """Initialize with some sample tasks"""
+        """Initialize with some sample tasks
+
+        The rows are trusted, so they are built directly with fixed ids rather
+        than validated and inserted one at a time through ``create_task``.
+        """
+        now = time.time_ns()
         sample_tasks = [
-            TaskCreate(
+            TaskRow(
+                id=1,
                 title="Set up CI/CD pipeline",
                 description="Configure GitHub Actions for automated testing and deployment",
-                status=TaskStatus.IN_PROGRESS,
+                status=TaskStatus.IN_PROGRESS.value,
+                created_at_ns=now,
+                updated_at_ns=now,
             ),
-            TaskCreate(
+            TaskRow(
+                id=2,
                 title="Write API documentation",
                 description="Create comprehensive API documentation with examples",
-                status=TaskStatus.PENDING,
+                status=TaskStatus.PENDING.value,
+                created_at_ns=now,
+                updated_at_ns=now,
             ),
-            TaskCreate(
+            TaskRow(
+                id=3,
                 title="Add authentication",
                 description="Implement JWT token-based authentication",
-                status=TaskStatus.PENDING,
+                status=TaskStatus.PENDING.value,
+                created_at_ns=now,
+                updated_at_ns=now,
             ),
         ]
 
-        for task_create in sample_tasks:
-            self.create_task(task_create)
-
-    def get_all_tasks(self) -> List[Task]:
-        """Get all tasks"""
-        return list(self._tasks.values())
-
-    def get_task(self, task_id: int) -> Optional[Task]:
+        self._tasks = {task.id: task for task in sample_tasks}
+        for task in sample_tasks:
+            self._by_status[task.status].add(task.id)
+            self._cache_task(task)
+        self._id_iter = itertools.count(len(sample_tasks) + 1)
+
+    def _cache_task(self, task: TaskRow) -> None:
+        """Serialize a task into the JSON cache"""
+        self._cached_json[task.id] = orjson.dumps(task.to_dict())
+
+    def get_all_tasks_json(self) -> bytes:
+        """Get all tasks as a serialized JSON array"""
+        all_json = self._all_json_cache
+        if all_json is None:
+            # Rebuild under the lock so a concurrent writer can't leave a
+            # stale blob behind after invalidating it
+            with self._lock:
+                all_json = self._all_json_cache
+                if all_json is None:
+                    all_json = b"[" + b",".join(self._cached_json.values()) + b"]"
+                    self._all_json_cache = all_json
+        return all_json
+
+    def _invalidate_list_json(self) -> None:
+        """Drop the cached JSON arrays after a mutation (lock must be held)"""
+        self._all_json_cache = None
+        self._status_json_cache.clear()
+
+    def get_tasks_by_status_json(self, status: str) -> bytes:
+        """Get tasks filtered by status as a serialized JSON array"""
+        status_json = self._status_json_cache.get(status)
+        if status_json is None:
+            with self._lock:
+                status_json = self._status_json_cache.get(status)
+                if status_json is None:
+                    cached_json = self._cached_json
+                    ids = sorted(self._by_status.get(status, ()))
+                    status_json = b"[" + b",".join([cached_json[i] for i in ids]) + b"]"
+                    self._status_json_cache[status] = status_json
+        return status_json
+
+    def get_task(self, task_id: int) -> Optional[TaskRow]:
         """Get a task by ID"""
         return self._tasks.get(task_id)
 
-    def create_task(self, task_create: TaskCreate) -> Task:
+    def get_task_json(self, task_id: int) -> Optional[bytes]:
+        """Get a serialized task by ID"""
+        return self._cached_json.get(task_id)
+
+    # _time_ns/_TaskRow are bound as defaults so the hot write path uses fast local
+    # lookups instead of resolving module globals on every call
+    def create_task(
+        self, task_create: TaskCreate, _time_ns=time.time_ns, _TaskRow=TaskRow
+    ) -> TaskRow:
         """Create a new task"""
-        now = datetime.utcnow()
-        task = Task(
-            id=self._next_id,
-            title=task_create.title,
-            description=task_create.description,
-            status=task_create.status,
-            created_at=now,
-            updated_at=now,
-        )
-
-        self._tasks[self._next_id] = task
-        self._next_id += 1
-        return task
-
-    def update_task(self, task_id: int, task_update: TaskUpdate) -> Optional[Task]:
+        with self._lock:
+            task_id = next(self._id_iter)
+            now = _time_ns()
+            task = _TaskRow(
+                id=task_id,
+                title=task_create.title,
+                description=task_create.description,
+                status=sys.intern(task_create.status.value),
+                created_at_ns=now,
+                updated_at_ns=now,
+            )
+
+            self._tasks[task_id] = task
+            self._by_status[task.status].add(task_id)
+            self._cache_task(task)
+            self._invalidate_list_json()
+            return task
+
+    def update_task(
+        self, task_id: int, task_update: TaskUpdate, _time_ns=time.time_ns
+    ) -> Optional[TaskRow]:
         """Update an existing task"""
-        if task_id not in self._tasks:
-            return None
-
-        task = self._tasks[task_id]
-        update_data = task_update.model_dump(exclude_unset=True)
-
-        if update_data:
-            for field, value in update_data.items():
-                setattr(task, field, value)
-            task.updated_at = datetime.utcnow()
-
-        return task
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+
+            # Only fields sent by the client are set; read them straight off the
+            # model instead of building an intermediate dict
+            fields_set = task_update.model_fields_set
+            # TaskUpdate rejects an explicit null, so status is only non-None
+            # when the client actually sent one
+            status_update = task_update.status
+
+            if status_update is not None:
+                new_status = sys.intern(status_update.value)
+                self._by_status[task.status].discard(task_id)
+                self._by_status[new_status].add(task_id)
+
+            if fields_set:
+                for field in fields_set:
+                    setattr(task, field, getattr(task_update, field))
+                if status_update is not None:
+                    # Rows store the interned status value, not the enum member
+                    task.status = new_status
+                task.updated_at_ns = _time_ns()
+                self._cache_task(task)
+                self._invalidate_list_json()
+
+            return task
 
     def delete_task(self, task_id: int) -> bool:
         """Delete a task"""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
+        with self._lock:
+            # A single pop both checks membership and removes the row
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return False
+
+            self._by_status[task.status].discard(task_id)
+            del self._cached_json[task_id]
+            self._invalidate_list_json()
             return True
-        return False
-
-    def get_tasks_by_status(self, status: str) -> List[Task]:
-        """Get tasks filtered by status"""
-        return [task for task in self._tasks.values() if task.status == status]
 
     def get_task_count(self) -> int:
         """Get total number of tasks"""
@@ -92,5 +187,10 @@ class TaskDatabase:
 
     def clear_all_tasks(self) -> None:
         """Clear all tasks (useful for testing)"""
-        self._tasks.clear()
-        self._next_id = 1
+        with self._lock:
+            self._tasks.clear()
+            self._cached_json.clear()
+            self._invalidate_list_json()
+            for ids in self._by_status.values():
+                ids.clear()
+            self._id_iter = itertools.count(1)
@@ -1,15 +1,28 @@
-from fastapi import FastAPI, HTTPException, status
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List
 import uvicorn
 
-from .models import Task, TaskCreate, TaskUpdate
+from .models import Task, TaskCreate, TaskUpdate, TaskStatus
 from .database import TaskDatabase
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the database on startup rather than at import time"""
+    app.state.db = TaskDatabase()
+    yield
+
+
 app = FastAPI(
     title="Task Manager API",
     description="A simple task management API built with FastAPI",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -21,8 +34,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize database
-db = TaskDatabase()
+
+async def get_db(request: Request) -> TaskDatabase:
+    """Dependency returning the app's database (override it in tests)"""
+    # Declared async so FastAPI resolves it inline instead of in the threadpool
+    return request.app.state.db
 
 
 @app.get("/")
@@ -41,32 +57,36 @@ async def health_check():
     return {"status": "healthy", "service": "task-manager-api"}
 
 
-@app.get("/tasks", response_model=List[Task])
-async def get_tasks():
+# Read endpoints return pre-serialized JSON from the database cache, so the
+# response schema is only declared for the OpenAPI docs.
+@app.get("/tasks", responses={200: {"model": List[Task]}})
+def get_tasks(db: TaskDatabase = Depends(get_db)):
     """Get all tasks"""
-    return db.get_all_tasks()
+    return Response(content=db.get_all_tasks_json(), media_type="application/json")
 
 
-@app.get("/tasks/{task_id}", response_model=Task)
-async def get_task(task_id: int):
+@app.get("/tasks/{task_id}", responses={200: {"model": Task}})
+def get_task(task_id: int, db: TaskDatabase = Depends(get_db)):
     """Get a specific task by ID"""
-    task = db.get_task(task_id)
-    if not task:
+    task_json = db.get_task_json(task_id)
+    if task_json is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found",
         )
-    return task
+    return Response(content=task_json, media_type="application/json")
 
 
 @app.post("/tasks", response_model=Task, status_code=status.HTTP_201_CREATED)
-async def create_task(task: TaskCreate):
+def create_task(task: TaskCreate, db: TaskDatabase = Depends(get_db)):
     """Create a new task"""
-    return db.create_task(task)
+    return db.create_task(task).to_dict()
 
 
 @app.put("/tasks/{task_id}", response_model=Task)
-async def update_task(task_id: int, task_update: TaskUpdate):
+def update_task(
+    task_id: int, task_update: TaskUpdate, db: TaskDatabase = Depends(get_db)
+):
     """Update an existing task"""
     task = db.update_task(task_id, task_update)
     if not task:
@@ -74,11 +94,11 @@ async def update_task(task_id: int, task_update: TaskUpdate):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found",
         )
-    return task
+    return task.to_dict()
 
 
 @app.delete("/tasks/{task_id}")
-async def delete_task(task_id: int):
+def delete_task(task_id: int, db: TaskDatabase = Depends(get_db)):
     """Delete a task"""
     if not db.delete_task(task_id):
         raise HTTPException(
@@ -88,16 +108,14 @@ async def delete_task(task_id: int):
     return {"message": f"Task {task_id} deleted successfully"}
 
 
-@app.get("/tasks/status/{task_status}")
-async def get_tasks_by_status(task_status: str):
+@app.get("/tasks/status/{task_status}", responses={200: {"model": List[Task]}})
+def get_tasks_by_status(task_status: TaskStatus, db: TaskDatabase = Depends(get_db)):
     """Get tasks filtered by status"""
-    valid_statuses = ["pending", "in_progress", "completed"]
-    if task_status not in valid_statuses:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Must be one of: {valid_statuses}",
-        )
-    return db.get_tasks_by_status(task_status)
+    # Unknown statuses are rejected with a 422 by the enum path parameter
+    return Response(
+        content=db.get_tasks_by_status_json(task_status.value),
+        media_type="application/json",
+    )
 
 
 if __name__ == "__main__":
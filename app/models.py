@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum
 
 
@@ -21,16 +22,30 @@ class TaskBase(BaseModel):
 class TaskCreate(TaskBase):
     """Model for creating a new task"""
 
-    pass
+    # Request bodies are never mutated, and rejecting unknown fields lets
+    # pydantic-core skip collecting extras. Kept off TaskBase so the Task
+    # response model stays open and mutable.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class TaskUpdate(BaseModel):
     """Model for updating an existing task"""
 
+    # Same request-body config as TaskCreate
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     title: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     status: Optional[TaskStatus] = None
 
+    @field_validator("title", "status")
+    @classmethod
+    def reject_null(cls, value):
+        """These fields may be omitted, but not cleared with an explicit null"""
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
 
 class Task(TaskBase):
     """Complete task model with all fields"""
@@ -41,11 +56,11 @@ class Task(TaskBase):
         None, description="Task last update timestamp"
     )
 
-    class Config:
+    model_config = ConfigDict(
         # Enable ORM mode for database integration
-        from_attributes = True
+        from_attributes=True,
         # Example for JSON schema
-        json_schema_extra = {
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "title": "Complete project documentation",
@@ -54,4 +69,64 @@ class Task(TaskBase):
                 "created_at": "2024-01-15T10:30:00",
                 "updated_at": "2024-01-15T10:30:00",
             }
+        },
+    )
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert an epoch timestamp in nanoseconds to a naive UTC datetime"""
+    # Integer arithmetic keeps full microsecond precision (no float rounding)
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+@dataclass
+class TaskRow:
+    """Storage-only task record used inside the database layer
+
+    ``Task`` stays the wire schema; rows are plain slotted dataclasses so
+    they are cheap to create and hold no per-instance ``__dict__``.
+    Timestamps are kept as ``time.time_ns()`` integers and only turned into
+    datetimes when a task is serialized. ``status`` holds the interned enum
+    value so comparisons against it reduce to an identity check.
+    """
+
+    # Declared by hand rather than with slots=True to keep Python 3.9 support
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "created_at_ns",
+        "updated_at_ns",
+    )
+
+    id: int
+    title: str
+    description: Optional[str]
+    status: str
+    created_at_ns: int
+    updated_at_ns: Optional[int]
+
+    @property
+    def created_at(self) -> datetime:
+        return _ns_to_datetime(self.created_at_ns)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        if self.updated_at_ns is None:
+            return None
+        return _ns_to_datetime(self.updated_at_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row in the shape of the ``Task`` wire schema"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
@@ -1,35 +1,56 @@
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from app.main import app
 from app.database import TaskDatabase
-
-client = TestClient(app)
+from app.models import TaskCreate
 
 
 # Test fixtures
+@pytest.fixture(scope="module")
+def event_loop():
+    """Module-scoped event loop so the shared client outlives single tests"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """Async client sharing one in-process ASGI transport per module"""
+    # ASGITransport doesn't send lifespan events, so run startup here
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as c:
+            yield c
+
+
 @pytest.fixture
-def clean_database():
+def clean_database(client):
     """Reset database before each test"""
-    app.db.clear_all_tasks()
+    app.state.db.clear_all_tasks()
     yield
-    app.db.clear_all_tasks()
+    app.state.db.clear_all_tasks()
 
 
 class TestRootEndpoints:
     """Test basic endpoints"""
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, client):
         """Test the root endpoint"""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "version" in data
         assert data["version"] == "1.0.0"
 
-    def test_health_check(self):
+    async def test_health_check(self, client):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
@@ -39,21 +60,43 @@ class TestRootEndpoints:
 class TestTaskCRUD:
     """Test task CRUD operations"""
 
-    def test_get_all_tasks(self):
+    async def test_get_all_tasks(self, client):
         """Test getting all tasks"""
-        response = client.get("/tasks")
+        response = await client.get("/tasks")
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
 
-    def test_create_task(self):
+    async def test_get_all_tasks_empty(self, client, clean_database):
+        """Test getting all tasks from an empty database"""
+        response = await client.get("/tasks")
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_get_all_tasks_reflects_changes(self, client):
+        """Test that the task list stays current after each mutation"""
+        await client.get("/tasks")  # prime the cached list
+        create_response = await client.post("/tasks", json={"title": "Listed Task"})
+        task_id = create_response.json()["id"]
+        titles = {t["id"]: t["title"] for t in (await client.get("/tasks")).json()}
+        assert titles[task_id] == "Listed Task"
+
+        await client.put(f"/tasks/{task_id}", json={"title": "Renamed Task"})
+        titles = {t["id"]: t["title"] for t in (await client.get("/tasks")).json()}
+        assert titles[task_id] == "Renamed Task"
+
+        await client.delete(f"/tasks/{task_id}")
+        ids = [t["id"] for t in (await client.get("/tasks")).json()]
+        assert task_id not in ids
+
+    async def test_create_task(self, client):
         """Test creating a new task"""
         new_task = {
             "title": "Test Task",
             "description": "This is a test task",
             "status": "pending",
         }
-        response = client.post("/tasks", json=new_task)
+        response = await client.post("/tasks", json=new_task)
         assert response.status_code == 201
         data = response.json()
         assert data["title"] == new_task["title"]
@@ -62,48 +105,48 @@ class TestTaskCRUD:
         assert "id" in data
         assert "created_at" in data
 
-    def test_create_task_minimal(self):
+    async def test_create_task_minimal(self, client):
         """Test creating a task with minimal data"""
         new_task = {"title": "Minimal Task"}
-        response = client.post("/tasks", json=new_task)
+        response = await client.post("/tasks", json=new_task)
         assert response.status_code == 201
         data = response.json()
         assert data["title"] == new_task["title"]
         assert data["status"] == "pending"  # default status
 
-    def test_create_task_invalid_data(self):
+    async def test_create_task_invalid_data(self, client):
         """Test creating a task with invalid data"""
         invalid_task = {"title": ""}  # empty title
-        response = client.post("/tasks", json=invalid_task)
+        response = await client.post("/tasks", json=invalid_task)
         assert response.status_code == 422  # Validation error
 
-    def test_get_task_by_id(self):
+    async def test_get_task_by_id(self, client):
         """Test getting a specific task"""
         # First create a task
         new_task = {"title": "Get Test Task", "description": "For testing get endpoint"}
-        create_response = client.post("/tasks", json=new_task)
+        create_response = await client.post("/tasks", json=new_task)
         created_task = create_response.json()
         task_id = created_task["id"]
 
         # Then get it
-        response = client.get(f"/tasks/{task_id}")
+        response = await client.get(f"/tasks/{task_id}")
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == task_id
         assert data["title"] == new_task["title"]
 
-    def test_get_nonexistent_task(self):
+    async def test_get_nonexistent_task(self, client):
         """Test getting a task that doesn't exist"""
-        response = client.get("/tasks/999999")
+        response = await client.get("/tasks/999999")
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    def test_update_task(self):
+    async def test_update_task(self, client):
         """Test updating a task"""
         # Create a task first
         new_task = {"title": "Update Test Task"}
-        create_response = client.post("/tasks", json=new_task)
+        create_response = await client.post("/tasks", json=new_task)
         created_task = create_response.json()
         task_id = created_task["id"]
 
@@ -113,7 +156,7 @@ class TestTaskCRUD:
             "description": "Updated description",
             "status": "completed",
         }
-        response = client.put(f"/tasks/{task_id}", json=update_data)
+        response = await client.put(f"/tasks/{task_id}", json=update_data)
         assert response.status_code == 200
         data = response.json()
         assert data["title"] == update_data["title"]
@@ -121,45 +164,71 @@ class TestTaskCRUD:
         assert data["status"] == update_data["status"]
         assert data["updated_at"] != data["created_at"]
 
-    def test_update_nonexistent_task(self):
+    async def test_update_nonexistent_task(self, client):
         """Test updating a task that doesn't exist"""
         update_data = {"title": "Updated Title"}
-        response = client.put("/tasks/999999", json=update_data)
+        response = await client.put("/tasks/999999", json=update_data)
         assert response.status_code == 404
 
-    def test_delete_task(self):
+    async def test_update_task_null_title(self, client):
+        """Test that an explicit null title is rejected and the task stays usable"""
+        create_response = await client.post("/tasks", json={"title": "Null Title"})
+        task_id = create_response.json()["id"]
+
+        response = await client.put(f"/tasks/{task_id}", json={"title": None})
+        assert response.status_code == 422
+
+        response = await client.get(f"/tasks/{task_id}")
+        assert response.json()["title"] == "Null Title"
+
+        response = await client.put(f"/tasks/{task_id}", json={"title": "Renamed"})
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+
+    async def test_update_task_null_status(self, client):
+        """Test that an explicit null status is rejected and nothing changes"""
+        create_response = await client.post("/tasks", json={"title": "Null Status"})
+        task_id = create_response.json()["id"]
+
+        response = await client.put(f"/tasks/{task_id}", json={"status": None})
+        assert response.status_code == 422
+
+        response = await client.get(f"/tasks/{task_id}")
+        assert response.json()["status"] == "pending"
+
+    async def test_delete_task(self, client):
         """Test deleting a task"""
         # Create a task first
         new_task = {"title": "Delete Test Task"}
-        create_response = client.post("/tasks", json=new_task)
+        create_response = await client.post("/tasks", json=new_task)
         created_task = create_response.json()
         task_id = created_task["id"]
 
         # Delete it
-        response = client.delete(f"/tasks/{task_id}")
+        response = await client.delete(f"/tasks/{task_id}")
         assert response.status_code == 200
         data = response.json()
         assert "deleted successfully" in data["message"]
 
         # Verify it's gone
-        get_response = client.get(f"/tasks/{task_id}")
+        get_response = await client.get(f"/tasks/{task_id}")
         assert get_response.status_code == 404
 
-    def test_delete_nonexistent_task(self):
+    async def test_delete_nonexistent_task(self, client):
         """Test deleting a task that doesn't exist"""
-        response = client.delete("/tasks/999999")
+        response = await client.delete("/tasks/999999")
         assert response.status_code == 404
 
 
 class TestTaskFiltering:
     """Test task filtering functionality"""
 
-    def test_get_tasks_by_status_valid(self):
+    async def test_get_tasks_by_status_valid(self, client):
         """Test getting tasks by valid status"""
         # Test each valid status
         valid_statuses = ["pending", "in_progress", "completed"]
         for status in valid_statuses:
-            response = client.get(f"/tasks/status/{status}")
+            response = await client.get(f"/tasks/status/{status}")
             assert response.status_code == 200
             data = response.json()
             assert isinstance(data, list)
@@ -167,40 +236,93 @@ class TestTaskFiltering:
             for task in data:
                 assert task["status"] == status
 
-    def test_get_tasks_by_status_invalid(self):
+    async def test_get_tasks_by_status_after_update(self, client):
+        """Test that filtering reflects status changes and deletions"""
+        create_response = await client.post(
+            "/tasks", json={"title": "Filter Test Task"}
+        )
+        task_id = create_response.json()["id"]
+
+        async def ids_with_status(status):
+            response = await client.get(f"/tasks/status/{status}")
+            return [t["id"] for t in response.json()]
+
+        assert task_id in await ids_with_status("pending")
+
+        await client.put(f"/tasks/{task_id}", json={"status": "completed"})
+        assert task_id not in await ids_with_status("pending")
+        assert task_id in await ids_with_status("completed")
+
+        await client.delete(f"/tasks/{task_id}")
+        assert task_id not in await ids_with_status("completed")
+
+    async def test_get_tasks_by_status_invalid(self, client):
         """Test getting tasks by invalid status"""
-        response = client.get("/tasks/status/invalid_status")
-        assert response.status_code == 400
+        response = await client.get("/tasks/status/invalid_status")
+        assert response.status_code == 422
         data = response.json()
-        assert "Invalid status" in data["detail"]
+        assert data["detail"][0]["loc"] == ["path", "task_status"]
 
 
 class TestTaskValidation:
     """Test input validation"""
 
-    def test_task_title_too_long(self):
+    async def test_task_title_too_long(self, client):
         """Test task with title too long"""
         long_title = "x" * 101  # Max is 100 chars
         new_task = {"title": long_title}
-        response = client.post("/tasks", json=new_task)
+        response = await client.post("/tasks", json=new_task)
         assert response.status_code == 422
 
-    def test_task_description_too_long(self):
+    async def test_task_description_too_long(self, client):
         """Test task with description too long"""
         long_description = "x" * 501  # Max is 500 chars
         new_task = {"title": "Valid Title", "description": long_description}
-        response = client.post("/tasks", json=new_task)
+        response = await client.post("/tasks", json=new_task)
         assert response.status_code == 422
 
-    def test_invalid_status(self):
+    async def test_invalid_status(self, client):
         """Test task with invalid status"""
         new_task = {"title": "Valid Title", "status": "invalid_status"}
-        response = client.post("/tasks", json=new_task)
+        response = await client.post("/tasks", json=new_task)
+        assert response.status_code == 422
+
+    async def test_unknown_field(self, client):
+        """Test task with a field outside the schema"""
+        new_task = {"title": "Valid Title", "priority": "high"}
+        response = await client.post("/tasks", json=new_task)
+        assert response.status_code == 422
+
+        response = await client.put("/tasks/1", json={"priority": "high"})
         assert response.status_code == 422
 
+    async def test_unknown_fields_only_forbidden_on_requests(self, client):
+        """Test that only the request schemas are closed to extra fields"""
+        schemas = (await client.get("/openapi.json")).json()["components"]["schemas"]
+        assert schemas["TaskCreate"]["additionalProperties"] is False
+        assert schemas["TaskUpdate"]["additionalProperties"] is False
+        assert "additionalProperties" not in schemas["Task"]
+
+
+class TestTaskDatabase:
+    """Test the database layer directly"""
+
+    def test_writes_leave_list_json_to_be_rebuilt_lazily(self):
+        """Test that a create invalidates the list caches without rebuilding them"""
+        db = TaskDatabase()
+        db.get_all_tasks_json()
+        db.get_tasks_by_status_json("pending")
+
+        db.create_task(TaskCreate(title="Lazy Task"))
+        assert db._all_json_cache is None
+        assert db._status_json_cache == {}
+
+        assert b'"Lazy Task"' in db.get_all_tasks_json()
+        assert b'"Lazy Task"' in db.get_tasks_by_status_json("pending")
+
 
 # Integration test
-def test_full_task_lifecycle():
+async def test_full_task_lifecycle(client):
     """Test complete task lifecycle"""
     # 1. Create a task
     new_task = {
@@ -208,29 +330,29 @@ def test_full_task_lifecycle():
         "description": "Testing full lifecycle",
         "status": "pending",
     }
-    create_response = client.post("/tasks", json=new_task)
+    create_response = await client.post("/tasks", json=new_task)
     assert create_response.status_code == 201
     created_task = create_response.json()
     task_id = created_task["id"]
 
     # 2. Get the task
-    get_response = client.get(f"/tasks/{task_id}")
+    get_response = await client.get(f"/tasks/{task_id}")
     assert get_response.status_code == 200
 
     # 3. Update the task
     update_data = {"status": "in_progress"}
-    update_response = client.put(f"/tasks/{task_id}", json=update_data)
+    update_response = await client.put(f"/tasks/{task_id}", json=update_data)
     assert update_response.status_code == 200
 
     # 4. Verify update
-    get_updated_response = client.get(f"/tasks/{task_id}")
+    get_updated_response = await client.get(f"/tasks/{task_id}")
     updated_task = get_updated_response.json()
     assert updated_task["status"] == "in_progress"
 
     # 5. Delete the task
-    delete_response = client.delete(f"/tasks/{task_id}")
+    delete_response = await client.delete(f"/tasks/{task_id}")
     assert delete_response.status_code == 200
 
     # 6. Verify deletion
-    get_deleted_response = client.get(f"/tasks/{task_id}")
+    get_deleted_response = await client.get(f"/tasks/{task_id}")
     assert get_deleted_response.status_code == 404